@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import io
+import math
+import multiprocessing
+import os
 import platform
 import subprocess
 import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PIL import Image
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QObject, QSize, Qt, QThread, QTimer, Signal, Slot
 from PySide6.QtGui import QColor, QIcon, QImage, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
@@ -20,6 +27,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QSlider,
     QSpinBox,
@@ -27,8 +35,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from PySide6.QtGui import QCloseEvent
+
 try:
-    import cairosvg
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
 except OSError as e:
     import platform
 
@@ -69,6 +83,11 @@ LINUX_ICON_SIZES = [16, 22, 24, 32, 48, 64, 96, 128, 256, 512]
 ANDROID_ICON_SIZES = [48, 72, 96, 144, 192, 512]
 IOS_ICON_SIZES = [60, 76, 120, 152, 167, 180, 1024]
 
+# (s, s) pairs for the multi-image icon containers, largest first as their
+# writers want them, built once here instead of on every export.
+WINDOWS_ICO_SIZE_PAIRS = tuple((s, s) for s in sorted(WINDOWS_ICO_SIZES, reverse=True))
+MAC_ICON_SIZE_PAIRS = tuple((s, s) for s in sorted(MAC_ICON_SIZES, reverse=True))
+
 DESKTOP_WALLPAPERS = [
     QSize(1280, 720),
     QSize(1920, 1080),
@@ -84,6 +103,9 @@ PHONE_WALLPAPERS = [
 TABLET_PORTRAIT_WALLPAPERS = [QSize(1536, 2048), QSize(1668, 2388), QSize(1600, 2560)]
 TABLET_LANDSCAPE_WALLPAPERS = [QSize(2048, 1536), QSize(2388, 1668), QSize(2560, 1600)]
 
+# Longest side the live preview renders at, unless the preview label is larger.
+PREVIEW_MAX_SIDE = 512
+
 
 # ---------- Utilities ----------
 def unique_path(path: Path) -> Path:
@@ -104,76 +126,153 @@ def qcolor_to_rgba_tuple(c: QColor) -> tuple[int, int, int, int]:
 def pillow_flatten(img: Image.Image, bg_rgba: tuple[int, int, int, int]) -> Image.Image:
     """Flatten any image onto an opaque RGB background (needed for JPG/BMP/PDF)."""
     if img.mode != "RGBA":
-        return img.convert("RGB")
+        return img if img.mode == "RGB" else img.convert("RGB")
     # Use only RGB for background, ignore alpha
     bg_rgb = bg_rgba[:3]
     bg = Image.new("RGB", img.size, bg_rgb)
-    img_rgb = img.convert("RGB")
-    bg.paste(img_rgb, mask=img.split()[3])  # Use alpha channel as mask
+    # An RGBA mask is read as its alpha band, so this is a single blend with no
+    # intermediate RGB copy or split-out alpha image.
+    bg.paste(img, mask=img)
     return bg
 
 
+def save_image(img: Image.Image, out: Path, fast: bool = False) -> None:
+    """Save an exported image, format chosen by the file extension.
+
+    fast=True trades file size for speed: PNG is written at zlib level 1
+    instead of Pillow's default 6, which is several times quicker on large
+    images at a modest size cost. Other formats are unaffected; Pillow's JPEG
+    defaults are already non-optimised and non-progressive.
+    """
+    if fast and out.suffix.lower() == ".png":
+        img.save(out, compress_level=1)
+    else:
+        img.save(out)
+
+
 def pillow_to_qpixmap(img: Image.Image) -> QPixmap:
-    """Convert Pillow Image to QPixmap for preview."""
+    """Convert Pillow Image to QPixmap for preview.
+
+    Wraps Pillow's raw pixel buffer in a QImage directly rather than encoding
+    to PNG and decoding it again, which ran on every preview update.
+    """
     if img.mode not in ("RGB", "RGBA"):
         img = img.convert("RGBA")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    qimg = QImage.fromData(buf.getvalue())  # Removed format string for Pylance type compatibility
-    return QPixmap.fromImage(qimg)
+    if img.mode == "RGBA":
+        fmt, channels = QImage.Format.Format_RGBA8888, 4
+    else:
+        fmt, channels = QImage.Format.Format_RGB888, 3
+    data = img.tobytes("raw", img.mode)
+    qimg = QImage(data, img.width, img.height, img.width * channels, fmt)
+    # QImage borrows `data`; copy() detaches it before the bytes are freed.
+    return QPixmap.fromImage(qimg.copy())
 
 
 # ---------- CairoSVG-based rendering (single source of truth) ----------
-def render_svg_to_pillow(
-    svg_path: str,
-    width: int,
-    height: int,
-    zoom: float = 1.0,
-    padding: int = 0,
-    transparent: bool = True,
-    bg_color: QColor | None = None,
-) -> Image.Image:
-    """Render SVG -> PNG bytes (CairoSVG), load into Pillow.
+def _load_svg_bytes(svg_path: str) -> bytes:
+    """Read an SVG source once so every export size renders from the same bytes."""
+    return Path(svg_path).read_bytes()
 
-    Zoom semantics:
-      - 1.0 = full fit inside (width,height) minus padding
-      - 0.1..1.0 = shrink proportionally
-      - never exceeds full fit (no overscale)
+
+def parse_svg(svg_path: str, svg_bytes: bytes | None = None) -> Tree:
+    """Parse an SVG into a CairoSVG tree for exactly one render.
+
+    A tree cannot be drawn twice: CairoSVG edits nodes while drawing (`<use>`
+    loses its x/y, pattern and mask nodes are rewritten), so a second render
+    from the same tree misplaces or drops that content. Multi-size exports
+    therefore share the bytes from _load_svg_bytes, not the tree, and parse
+    afresh per render. The path is kept as the tree URL so relative
+    references still resolve.
     """
-    bg = bg_color if bg_color is not None else QColor("white")
+    if svg_bytes is None:
+        svg_bytes = _load_svg_bytes(svg_path)
+    return Tree(bytestring=svg_bytes, url=svg_path)
 
-    # Clamp zoom to [0.1, 1.0] so we only zoom OUT (never overscale)
-    zoom = max(0.1, min(1.0, zoom))
 
-    # Content area inside padding
+def _content_geometry(
+    width: int, height: int, zoom: float, padding: int
+) -> tuple[int, int, int, int, int, int]:
+    """Return (canvas_w, canvas_h, work_w, work_h, render_w, render_h).
+
+    The work area is the canvas minus padding; the render size is the work
+    area scaled by zoom, clamped to [0.1, 1.0] so we only zoom OUT.
+    """
+    zoom = max(0.1, min(1.0, zoom))
     canvas_w = max(1, width)
     canvas_h = max(1, height)
     work_w = max(1, canvas_w - 2 * padding)
     work_h = max(1, canvas_h - 2 * padding)
-
-    # Render size respects zoom relative to work area
     render_w = int(max(1, work_w * zoom))
     render_h = int(max(1, work_h * zoom))
+    return canvas_w, canvas_h, work_w, work_h, render_w, render_h
+
+
+def _aspect_key(width: int, height: int, zoom: float, padding: int) -> tuple[int, int]:
+    """Reduced aspect ratio of the content box for one output size.
+
+    Content boxes with the same key scale into each other exactly, so they
+    can share one master render.
+    """
+    *_, render_w, render_h = _content_geometry(width, height, zoom, padding)
+    div = math.gcd(render_w, render_h)
+    return render_w // div, render_h // div
 
-    # CairoSVG render
-    png_bytes = cairosvg.svg2png(
-        url=svg_path,
+
+def _render_svg_content(
+    tree: Tree, render_w: int, render_h: int, background_color: str | None
+) -> Image.Image:
+    """Rasterise a parsed SVG to exactly (render_w, render_h), aspect-fitted.
+
+    Pixels are read straight from CairoSVG's in-memory Cairo surface rather
+    than encoded to PNG and decoded again. Cairo stores premultiplied ARGB32
+    in native byte order, which is Pillow's "BGRa" raw mode on little-endian
+    machines; elsewhere the PNG round trip is kept as the portable path.
+    """
+    # Same defaults as cairosvg.svg2png (96 dpi), but from an already-parsed
+    # tree. output=None renders in memory without writing anything.
+    surface = PNGSurface(
+        tree,
+        None,
+        96,
         output_width=render_w,
         output_height=render_h,
-        background_color=None if transparent else f"rgb({bg.red()},{bg.green()},{bg.blue()})",
+        background_color=background_color,
     )
-    content = Image.open(io.BytesIO(png_bytes if png_bytes is not None else b""))
-    content.load()
-    content = content.convert("RGBA" if transparent else "RGB")
+    image_surface = surface.cairo
+    image_surface.flush()
+    if sys.byteorder == "little":
+        # frombuffer copies here because the raw mode differs from the image
+        # mode, so the result outlives the Cairo surface.
+        content = Image.frombuffer(
+            "RGBA",
+            (surface.width, surface.height),
+            image_surface.get_data(),
+            "raw",
+            "BGRa",
+            image_surface.get_stride(),
+            1,
+        )
+    else:
+        png_buf = io.BytesIO()
+        image_surface.write_to_png(png_buf)
+        png_buf.seek(0)
+        content = Image.open(png_buf)
+        content.load()
+    surface.finish()
+    return content
+
 
-    # Safety: if computed size slightly exceeds work area due to rounding
-    cw, ch = content.size
-    scale = min(work_w / cw, work_h / ch, 1.0)
-    if scale < 1.0:
-        new_size = (max(1, int(cw * scale)), max(1, int(ch * scale)))
-        content = content.resize(new_size, LANCZOS_RESAMPLE)
+def _place_on_canvas(
+    content: Image.Image, canvas_w: int, canvas_h: int, transparent: bool, bg: QColor
+) -> Image.Image:
+    """Centre rendered content on a transparent or background-coloured canvas.
 
-    # Canvas
+    When the content already fills the canvas (no padding, zoom 100%) and is
+    in the output mode, it is returned as is: compositing it onto a blank
+    canvas would be a full-image pass that changes nothing.
+    """
+    if content.size == (canvas_w, canvas_h) and content.mode == ("RGBA" if transparent else "RGB"):
+        return content
     if transparent:
         canvas = Image.new("RGBA", (canvas_w, canvas_h), (0, 0, 0, 0))
         # Center composite
@@ -188,14 +287,138 @@ def render_svg_to_pillow(
     canvas = Image.new("RGB", (canvas_w, canvas_h), (bg.red(), bg.green(), bg.blue()))
     cx = (canvas_w - content.size[0]) // 2
     cy = (canvas_h - content.size[1]) // 2
-    # If content has alpha, use it as mask
+    # If content has alpha, use it as mask. An RGBA mask is read as its alpha
+    # band, so no RGB copy or split-out bands are allocated.
     if content.mode == "RGBA":
-        canvas.paste(content.convert("RGB"), (cx, cy), mask=content.split()[3])
+        canvas.paste(content, (cx, cy), mask=content)
     else:
         canvas.paste(content, (cx, cy))
     return canvas
 
 
+def render_svg_to_pillow(
+    svg_path: str,
+    width: int,
+    height: int,
+    zoom: float = 1.0,
+    padding: int = 0,
+    transparent: bool = True,
+    bg_color: QColor | None = None,
+    svg_bytes: bytes | None = None,
+) -> Image.Image:
+    """Render SVG -> PNG bytes (CairoSVG), load into Pillow.
+
+    Pass `svg_bytes` (from _load_svg_bytes) to skip re-reading the file when
+    rendering the same source at several sizes.
+
+    Zoom semantics:
+      - 1.0 = full fit inside (width,height) minus padding
+      - 0.1..1.0 = shrink proportionally
+      - never exceeds full fit (no overscale)
+    """
+    bg = bg_color if bg_color is not None else QColor("white")
+
+    canvas_w, canvas_h, work_w, work_h, render_w, render_h = _content_geometry(
+        width, height, zoom, padding
+    )
+
+    content = _render_svg_content(
+        parse_svg(svg_path, svg_bytes),
+        render_w,
+        render_h,
+        None if transparent else f"rgb({bg.red()},{bg.green()},{bg.blue()})",
+    )
+    content = content.convert("RGBA" if transparent else "RGB")
+
+    # Safety: if computed size slightly exceeds work area due to rounding.
+    # thumbnail() keeps the aspect ratio and, with reducing_gap, box-reduces
+    # large factors before the Lanczos pass.
+    try:
+        content.thumbnail((work_w, work_h), LANCZOS_RESAMPLE, reducing_gap=2.0)
+    except TypeError:  # Pillow<7 has no reducing_gap
+        cw, ch = content.size
+        scale = min(work_w / cw, work_h / ch, 1.0)
+        if scale < 1.0:
+            new_size = (max(1, int(cw * scale)), max(1, int(ch * scale)))
+            content = content.resize(new_size, LANCZOS_RESAMPLE)
+
+    return _place_on_canvas(content, canvas_w, canvas_h, transparent, bg)
+
+
+def render_svg_sizes(
+    svg_path: str,
+    sizes: Sequence[tuple[int, int]],
+    zoom: float = 1.0,
+    padding: int = 0,
+    transparent: bool = True,
+    bg_color: QColor | None = None,
+    svg_bytes: bytes | None = None,
+    high_fidelity: bool = False,
+) -> Iterator[tuple[tuple[int, int], Image.Image]]:
+    """Yield ((width, height), image) for each size, in the order given.
+
+    Rasterising is far more expensive than a Lanczos downscale, so by default
+    the SVG is rendered once per content aspect ratio, at the largest size
+    that needs it, and smaller sizes are resized from that master. Square icon
+    sets therefore cost one CairoSVG render regardless of how many sizes they
+    contain. Padding is still applied per size in pixels, exactly as in
+    render_svg_to_pillow.
+
+    high_fidelity=True renders every size from the vector source instead, for
+    when small sizes should get Cairo's own antialiasing rather than a resample.
+
+    The file is read once (or `svg_bytes` is used) and each render parses its
+    own tree from those bytes; see parse_svg for why trees are not shared.
+    """
+    bg = bg_color if bg_color is not None else QColor("white")
+    if svg_bytes is None:
+        svg_bytes = _load_svg_bytes(svg_path)
+
+    if high_fidelity:
+        for w, h in sizes:
+            yield (
+                (w, h),
+                render_svg_to_pillow(
+                    svg_path, w, h, zoom, padding, transparent, bg_color=bg, svg_bytes=svg_bytes
+                ),
+            )
+        return
+
+    # Each aspect group shares the master rendered at its largest box.
+    geometry = {size: _content_geometry(*size, zoom, padding) for size in sizes}
+    largest: dict[tuple[int, int], tuple[int, int]] = {}
+    for size, (*_, render_w, render_h) in geometry.items():
+        key = _aspect_key(*size, zoom, padding)
+        if key not in largest or render_w > largest[key][0]:
+            largest[key] = (render_w, render_h)
+
+    masters: dict[tuple[int, int], Image.Image] = {}
+    for size in sizes:
+        canvas_w, canvas_h, _, _, render_w, render_h = geometry[size]
+        key = _aspect_key(*size, zoom, padding)
+        if key not in masters:
+            master = _render_svg_content(
+                parse_svg(svg_path, svg_bytes), *largest[key], None
+            ).convert("RGBA")
+            # Opaque output: flatten once here so each size resizes three
+            # channels and pastes without a mask, instead of blending per size.
+            # Pillow resamples RGBA premultiplied, so the order does not change
+            # the result beyond rounding.
+            masters[key] = (
+                master if transparent else pillow_flatten(master, qcolor_to_rgba_tuple(bg))
+            )
+        content = masters[key]
+        if content.size != (render_w, render_h):
+            content = content.resize((render_w, render_h), LANCZOS_RESAMPLE)
+        yield size, _place_on_canvas(content, canvas_w, canvas_h, transparent, bg)
+
+
+def load_png_master(png_path: str) -> Image.Image:
+    """Decode a raster input once, as the RGBA master every size resizes from."""
+    with Image.open(png_path) as src:
+        return src.convert("RGBA")
+
+
 def render_png_to_pillow(
     png_path: str,
     width: int,
@@ -204,11 +427,14 @@ def render_png_to_pillow(
     padding: int = 0,
     transparent: bool = True,
     bg_color: QColor | None = None,
+    image: Image.Image | None = None,
 ) -> Image.Image:
     """Render a raster input to (width, height), honouring zoom and padding.
 
     The raster counterpart to render_svg_to_pillow, with identical geometry and
     background semantics so a PNG input behaves the same as an SVG input.
+    Pass `image` (the decoded RGBA source) to skip re-reading the file when
+    rendering the same source at several sizes; it is not modified.
 
     Previously the PNG path resized straight to the target size, which silently
     discarded the zoom and padding controls and, when transparency was off,
@@ -227,16 +453,15 @@ def render_png_to_pillow(
     work_w = max(1, canvas_w - 2 * padding)
     work_h = max(1, canvas_h - 2 * padding)
 
-    content = Image.open(png_path)
-    content.load()
-    content = content.convert("RGBA")
+    if image is None:
+        image = load_png_master(png_path)
 
     # Fit inside the work area preserving aspect ratio, then apply zoom.
-    cw, ch = content.size
+    cw, ch = image.size
     fit = min(work_w / cw, work_h / ch)
     target_w = max(1, int(cw * fit * zoom))
     target_h = max(1, int(ch * fit * zoom))
-    content = content.resize((target_w, target_h), LANCZOS_RESAMPLE)
+    content = image.resize((target_w, target_h), LANCZOS_RESAMPLE)
 
     cx = (canvas_w - content.size[0]) // 2
     cy = (canvas_h - content.size[1]) // 2
@@ -247,10 +472,69 @@ def render_png_to_pillow(
         return canvas
 
     canvas = Image.new("RGB", (canvas_w, canvas_h), (bg.red(), bg.green(), bg.blue()))
-    canvas.paste(content.convert("RGB"), (cx, cy), mask=content.split()[3])
+    canvas.paste(content, (cx, cy), mask=content)
     return canvas
 
 
+# Recent preview renders, most recently used last. Preview only: exports
+# render each size once, so caching them would only hold memory.
+_PREVIEW_CACHE_SIZE = 16
+_preview_cache: OrderedDict[tuple[object, ...], Image.Image] = OrderedDict()
+
+
+def render_svg_preview(
+    svg_path: str,
+    width: int,
+    height: int,
+    zoom: float,
+    padding: int,
+    transparent: bool,
+    bg_color: QColor,
+    svg_bytes: bytes | None = None,
+) -> Image.Image:
+    """Render a preview via render_svg_to_pillow, memoised in a small LRU cache.
+
+    Flicking a checkbox or returning a slider to an earlier value re-requests
+    a render that was just made. The key includes the file's mtime, so an
+    edited SVG is never served from the cache; its stale entries are dropped.
+    The returned image is shared with the cache and must not be mutated.
+
+    Pass `svg_bytes` to render cache misses from an already-read source.
+    """
+    mtime = Path(svg_path).stat().st_mtime_ns
+    key = (
+        svg_path,
+        mtime,
+        width,
+        height,
+        round(zoom, 3),
+        padding,
+        transparent,
+        qcolor_to_rgba_tuple(bg_color),
+    )
+    cached = _preview_cache.get(key)
+    if cached is not None:
+        _preview_cache.move_to_end(key)
+        return cached
+
+    for stale in [k for k in _preview_cache if k[0] == svg_path and k[1] != mtime]:
+        del _preview_cache[stale]
+    img = render_svg_to_pillow(
+        svg_path,
+        width,
+        height,
+        zoom=zoom,
+        padding=padding,
+        transparent=transparent,
+        bg_color=bg_color,
+        svg_bytes=svg_bytes,
+    )
+    _preview_cache[key] = img
+    if len(_preview_cache) > _PREVIEW_CACHE_SIZE:
+        _preview_cache.popitem(last=False)
+    return img
+
+
 def macos_iconset_entries(sizes: list[int]) -> list[tuple[str, int]]:
     """Return the (filename, pixel_size) pairs iconutil accepts.
 
@@ -273,6 +557,111 @@ def macos_iconset_entries(sizes: list[int]) -> list[tuple[str, int]]:
 
 
 # ---------- EXPORTS ----------
+def _render_and_save_batch(
+    svg_path: str,
+    svg_bytes: bytes,
+    targets: list[tuple[tuple[int, int], Path]],
+    zoom: float,
+    padding: int,
+    transparent: bool,
+    bg_rgba: tuple[int, int, int, int],
+    fmt: str,
+    high_fidelity: bool,
+    fast: bool,
+    progress: Callable[[int, int], None] | None = None,
+) -> None:
+    """Render one batch of sizes and save each to its path.
+
+    Module-level and free of Qt objects in its arguments so worker processes
+    can pickle it; the source travels as bytes so no worker re-reads the disk.
+    `progress(done, total)` is only passed when the batch runs inline.
+    """
+    bg = QColor(*bg_rgba)
+    rendered = render_svg_sizes(
+        svg_path,
+        [size for size, _ in targets],
+        zoom=zoom,
+        padding=padding,
+        transparent=transparent,
+        bg_color=bg,
+        svg_bytes=svg_bytes,
+        high_fidelity=high_fidelity,
+    )
+    flatten = fmt in ("jpg", "jpeg", "bmp") or not transparent
+    for done, ((_, out), (_, img)) in enumerate(zip(targets, rendered), start=1):
+        save_image(pillow_flatten(img, bg_rgba) if flatten else img, out, fast)
+        if progress is not None:
+            progress(done, len(targets))
+
+
+def _export_size_set(
+    svg_path: str,
+    targets: list[tuple[tuple[int, int], Path]],
+    zoom: float,
+    padding: int,
+    transparent: bool,
+    bg: QColor,
+    fmt: str,
+    high_fidelity: bool,
+    fast: bool,
+    progress: Callable[[int, int], None] | None = None,
+) -> None:
+    """Render and save a size set, spreading independent batches over processes.
+
+    Sizes that share a master render (see render_svg_sizes) form one batch;
+    with high_fidelity every size is its own batch. Batches have no shared
+    state, so each runs in its own worker process, sidestepping the GIL. A
+    single batch runs inline rather than paying for a pool.
+
+    `progress(done, total)` counts saved images: per image inline, per
+    completed batch when pooled.
+    """
+    batches: dict[tuple[int, int], list[tuple[tuple[int, int], Path]]] = {}
+    for target in targets:
+        size = target[0]
+        key = size if high_fidelity else _aspect_key(*size, zoom, padding)
+        batches.setdefault(key, []).append(target)
+
+    task = partial(
+        _render_and_save_batch,
+        svg_path,
+        _load_svg_bytes(svg_path),
+        zoom=zoom,
+        padding=padding,
+        transparent=transparent,
+        bg_rgba=qcolor_to_rgba_tuple(bg),
+        fmt=fmt,
+        high_fidelity=high_fidelity,
+        fast=fast,
+    )
+    if len(batches) == 1:
+        task(next(iter(batches.values())), progress=progress)
+        return
+    workers = min(len(batches), os.cpu_count() or 1)
+    done = 0
+    # Always spawn, as macOS and Windows already do: exports run on a QThread
+    # inside a QApplication, and forking a multithreaded Qt process (the
+    # Linux default before Python 3.14) can deadlock the child.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # Consuming the results re-raises a failure from any worker here.
+        for batch, _ in zip(batches.values(), pool.map(task, batches.values())):
+            done += len(batch)
+            if progress is not None:
+                progress(done, len(targets))
+
+
+def _icon_padding(padding: int, size: int, base: int) -> int:
+    """Padding for one icon entry, given `padding` in pixels at the base size.
+
+    Icon padding is set against the largest entry, which is what the preview
+    shows, and shrinks with the smaller ones exactly as when every entry was
+    downsampled from that one render. Applied as absolute pixels instead, a
+    padding of 20 would leave a 16px entry a 1px work area.
+    """
+    return round(padding * size / base)
+
+
 def save_windows_ico(
     svg_path: str,
     out_dir: Path,
@@ -282,26 +671,46 @@ def save_windows_ico(
     padding: int,
     bg: QColor,
 ) -> None:
-    """Save a multi-resolution Windows .ico from one Pillow image.
+    """Save a multi-resolution Windows .ico with every entry rendered from vector.
+
+    Each size is rasterised by CairoSVG at its own resolution (from one read
+    of the file) and embedded as-is, rather than Pillow downsampling a single 256px
+    master, so small entries stay crisp. Padding scales with each entry; see
+    _icon_padding.
 
     Background is already applied by the render step when transparent=False.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    # Largest first: Pillow's ICO writer skips sizes bigger than the base image.
+    if sizes == WINDOWS_ICO_SIZES:
+        pairs = WINDOWS_ICO_SIZE_PAIRS
+    else:
+        pairs = tuple((s, s) for s in sorted(sizes, reverse=True))
     base = max(sizes)
-    src = render_svg_to_pillow(
-        svg_path,
-        base,
-        base,
-        zoom=zoom,
-        padding=padding,
-        transparent=transparent,
-        bg_color=bg,
-    )
+    svg_bytes = _load_svg_bytes(svg_path)
+    images = [
+        render_svg_to_pillow(
+            svg_path,
+            s,
+            s,
+            zoom=zoom,
+            padding=_icon_padding(padding, s, base),
+            transparent=transparent,
+            bg_color=bg,
+            svg_bytes=svg_bytes,
+        )
+        for s, _ in pairs
+    ]
     # Always convert to RGB, dropping any alpha channel
-    if not transparent and src.mode != "RGB":
-        src = src.convert("RGB")
+    if not transparent:
+        images = [img if img.mode == "RGB" else img.convert("RGB") for img in images]
     ico_path = unique_path(out_dir / "icon.ico")
-    src.save(ico_path, format="ICO", sizes=[(s, s) for s in sizes])
+    images[0].save(
+        ico_path,
+        format="ICO",
+        sizes=pairs,
+        append_images=images[1:],
+    )
 
 
 def save_macos_icns(
@@ -315,25 +724,41 @@ def save_macos_icns(
 ) -> None:
     """Save a macOS .icns, falling back to iconutil when Pillow cannot.
 
+    As with save_windows_ico, every size is rendered from vector, with padding
+    scaled per entry, and handed to Pillow via append_images instead of being
+    resampled from one master. The same renders feed the iconset when the
+    fallback runs.
+
     Fallback to iconutil on macOS ONLY if Pillow save fails.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    # Read once: the iconutil fallback may render further iconset entries.
+    svg_bytes = _load_svg_bytes(svg_path)
+    if sizes_for_check == MAC_ICON_SIZES:
+        pairs = MAC_ICON_SIZE_PAIRS
+    else:
+        pairs = tuple((s, s) for s in sorted(sizes_for_check, reverse=True))
     base = max(sizes_for_check)
-    src = render_svg_to_pillow(
-        svg_path,
-        base,
-        base,
-        zoom=zoom,
-        padding=padding,
-        transparent=transparent,
-        bg_color=bg,
-    )
+    images = {
+        s: render_svg_to_pillow(
+            svg_path,
+            s,
+            s,
+            zoom=zoom,
+            padding=_icon_padding(padding, s, base),
+            transparent=transparent,
+            bg_color=bg,
+            svg_bytes=svg_bytes,
+        )
+        for s, _ in pairs
+    }
     if not transparent:
-        src = pillow_flatten(src, qcolor_to_rgba_tuple(bg))
+        images = {s: pillow_flatten(img, qcolor_to_rgba_tuple(bg)) for s, img in images.items()}
+    src, *others = images.values()
 
     icns_path = unique_path(out_dir / "icon.icns")
     try:
-        src.save(icns_path, format="ICNS")
+        src.save(icns_path, format="ICNS", append_images=others)
     except Exception as e:
         if platform.system() == "Darwin":
             iconset = out_dir / "icon.iconset"
@@ -342,15 +767,18 @@ def save_macos_icns(
             # entries come from macos_iconset_entries rather than from the
             # configured size list.
             for filename, px in macos_iconset_entries(sizes_for_check):
-                img = render_svg_to_pillow(
-                    svg_path,
-                    px,
-                    px,
-                    zoom=zoom,
-                    padding=padding,
-                    transparent=transparent,
-                    bg_color=bg,
-                )
+                img = images.get(px)
+                if img is None:
+                    img = render_svg_to_pillow(
+                        svg_path,
+                        px,
+                        px,
+                        zoom=zoom,
+                        padding=_icon_padding(padding, px, base),
+                        transparent=transparent,
+                        bg_color=bg,
+                        svg_bytes=svg_bytes,
+                    )
                 img.save(iconset / filename)
             proc = subprocess.run(
                 ["iconutil", "-c", "icns", str(iconset), "-o", str(icns_path)],
@@ -381,24 +809,23 @@ def save_png_set(
     padding: int,
     bg: QColor,
     fmt: str = "png",
+    high_fidelity: bool = False,
+    fast: bool = False,
+    progress: Callable[[int, int], None] | None = None,
 ) -> None:
-    """Export a PNG/JPG/BMP size set, baking the background when needed."""
+    """Export a PNG/JPG/BMP size set, baking the background when needed.
+
+    Sizes are resized from one master render unless high_fidelity is set;
+    see render_svg_sizes. fast selects quicker PNG encoding; see save_image.
+    progress(done, total) is called as images are written.
+    """
     fmt = fmt.lower()
     base = out_dir / label / name
     base.mkdir(parents=True, exist_ok=True)
-    for s in sizes:
-        img = render_svg_to_pillow(
-            svg_path,
-            s,
-            s,
-            zoom=zoom,
-            padding=padding,
-            transparent=transparent,
-            bg_color=bg,
-        )
-        if fmt in ("jpg", "jpeg", "bmp") or not transparent:
-            img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-        img.save(base / f"{name}_{s}x{s}.{fmt}")
+    targets = [((s, s), base / f"{name}_{s}x{s}.{fmt}") for s in sizes]
+    _export_size_set(
+        svg_path, targets, zoom, padding, transparent, bg, fmt, high_fidelity, fast, progress
+    )
 
 
 def save_wallpapers(
@@ -412,24 +839,27 @@ def save_wallpapers(
     padding: int,
     bg: QColor,
     fmt: str = "png",
+    high_fidelity: bool = False,
+    fast: bool = False,
+    progress: Callable[[int, int], None] | None = None,
 ) -> None:
-    """Export wallpaper images in PNG/JPG/BMP at each requested size."""
+    """Export wallpaper images in PNG/JPG/BMP at each requested size.
+
+    Sizes sharing an aspect ratio are resized from one master render unless
+    high_fidelity is set; see render_svg_sizes. fast selects quicker PNG
+    encoding; see save_image. progress(done, total) is called as images are
+    written.
+    """
     fmt = fmt.lower()
     base = out_dir / "wallpapers" / label / name
     base.mkdir(parents=True, exist_ok=True)
-    for sz in sizes:
-        img = render_svg_to_pillow(
-            svg_path,
-            sz.width(),
-            sz.height(),
-            zoom=zoom,
-            padding=padding,
-            transparent=transparent,
-            bg_color=bg,
-        )
-        if fmt in ("jpg", "jpeg", "bmp") or not transparent:
-            img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-        img.save(base / f"{name}_{sz.width()}x{sz.height()}.{fmt}")
+    targets = [
+        ((sz.width(), sz.height()), base / f"{name}_{sz.width()}x{sz.height()}.{fmt}")
+        for sz in sizes
+    ]
+    _export_size_set(
+        svg_path, targets, zoom, padding, transparent, bg, fmt, high_fidelity, fast, progress
+    )
 
 
 def save_custom(
@@ -443,6 +873,7 @@ def save_custom(
     zoom: float,
     padding: int,
     bg: QColor,
+    fast: bool = False,
 ) -> None:
     """Export a single image at a custom size in PNG/JPG/PDF/BMP."""
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -458,10 +889,78 @@ def save_custom(
     else:
         if fmt in ("jpg", "jpeg", "bmp") or not transparent:
             img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-        img.save(out)
+        save_image(img, out, fast)
 
 
 # ---------- GUI ----------
+class ExportWorker(QObject):
+    """Runs one export job off the GUI thread and reports back via signals.
+
+    The job receives a `progress(done, total)` callback. Exactly one of
+    `finished` or `error` is emitted when it ends.
+    """
+
+    finished = Signal()
+    progress = Signal(int, int)
+    error = Signal(str)
+
+    def __init__(self, job: Callable[[Callable[[int, int], None]], None]) -> None:
+        """Store the job; it starts when `run` is invoked on the worker thread."""
+        super().__init__()
+        self._job = job
+
+    @Slot()
+    def run(self) -> None:
+        """Execute the job, converting any failure into an `error` signal."""
+        try:
+            self._job(self.progress.emit)
+        # Broad catch is deliberate: any export failure must surface as a
+        # dialog rather than escaping the thread and leaving the UI waiting.
+        except Exception as e:  # noqa: BLE001
+            self.error.emit(str(e))
+        else:
+            self.finished.emit()
+
+
+class ExportProgressDialog(QProgressDialog):
+    """Modal export progress that the user cannot dismiss mid-export.
+
+    There is no cancel (a running CairoSVG render cannot be interrupted), so
+    Escape and the window's close button are ignored until finish() is
+    called. Dismissing it early would delete it (WA_DeleteOnClose) under the
+    progress handlers and unblock a main window whose thread is still running.
+    """
+
+    def __init__(self, parent: QWidget) -> None:
+        """Build the indeterminate, window-modal dialog."""
+        super().__init__("Exporting…", "", 0, 0, parent)
+        self.setCancelButton(None)
+        self.setWindowTitle("Export")
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+        self.setMinimumDuration(0)
+        # Parented to the window, so without this every export would leave
+        # its closed dialog behind until the window itself is destroyed.
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self._finished = False
+
+    def finish(self) -> None:
+        """Close (and so delete) the dialog once the export has ended."""
+        self._finished = True
+        self.close()
+
+    def reject(self) -> None:
+        """Ignore Escape until the export has finished."""
+        if self._finished:
+            super().reject()
+
+    def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802  (Qt override)
+        """Ignore the window's close button until the export has finished."""
+        if self._finished:
+            super().closeEvent(event)
+        else:
+            event.ignore()
+
+
 class SvgConverterApp(QWidget):
     """Main window: pick an SVG or PNG, choose a profile, export image sets."""
 
@@ -473,6 +972,16 @@ class SvgConverterApp(QWidget):
 
         self.svg_path: str | None = None
         self.bgColor = QColor("white")
+        self._last_scaled = QPixmap()
+        self._last_scaled_key: tuple[Image.Image, int, int] | None = None
+        self._svg_bytes: bytes | None = None
+        self._svg_bytes_key: tuple[str, int] | None = None
+        self._png_master: Image.Image | None = None
+        self._png_master_key: tuple[str, int] | None = None
+        self._export_thread: QThread | None = None
+        self._export_worker: ExportWorker | None = None
+        self._export_dialog: ExportProgressDialog | None = None
+        self._export_out_dir: Path | None = None
 
         # Left: Preview  # noqa: ERA001  (section header, not commented-out code)
         self.previewLabel = QLabel("Preview")
@@ -519,6 +1028,17 @@ class SvgConverterApp(QWidget):
         self.paddingSpin.setValue(0)
         self.transparentBg = QCheckBox("Transparent background")
         self.transparentBg.setChecked(True)
+        self.fastExport = QCheckBox("Fast export (larger PNG files)")
+        self.fastExport.setToolTip(
+            "Write PNGs with light compression: much quicker for large wallpaper "
+            "sets, at the cost of bigger files."
+        )
+        self.highFidelity = QCheckBox("Render every size from vector (slower)")
+        self.highFidelity.setToolTip(
+            "Icon and wallpaper sets normally render once and downscale. Check this "
+            "to rasterise each size from the SVG, so small icons get Cairo's own "
+            "antialiasing instead of a resample."
+        )
         self.bgColorBtn = QPushButton("Choose Background Color")
         self.bgColorBtn.clicked.connect(self.choose_bg_color)
 
@@ -553,6 +1073,8 @@ class SvgConverterApp(QWidget):
         form.addRow("Padding:", self.paddingSpin)
         form.addRow(self.transparentBg)
         form.addRow(self.bgColorBtn)
+        form.addRow(self.fastExport)
+        form.addRow(self.highFidelity)
         form.addRow(self.zoomLabel)
         form.addRow(self.zoomSlider)
         form.addRow(self.createBtn)
@@ -562,7 +1084,13 @@ class SvgConverterApp(QWidget):
         root.addLayout(form, 0)
         self.setLayout(root)
 
-        # Signals for live preview
+        # Signals for live preview. Every change restarts one single-shot
+        # timer, so a slider drag renders once when it settles rather than
+        # once per intermediate value.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._do_update_preview)
         self.widthSpin.valueChanged.connect(self.update_preview)
         self.heightSpin.valueChanged.connect(self.update_preview)
         self.paddingSpin.valueChanged.connect(self.update_preview)
@@ -598,9 +1126,30 @@ class SvgConverterApp(QWidget):
             self.widthSpin.setEnabled(True)
             self.heightSpin.setEnabled(True)
 
+        # Fast encoding by default only for wallpaper sets, where large PNGs
+        # make compression the dominant cost; icon files keep full compression.
+        self.fastExport.setChecked(profile.startswith(("Export standard", "Export tablet")))
+        self.highFidelity.setEnabled(self._high_fidelity_applies())
+
         self.formatCombo.blockSignals(False)
         self.update_preview()
 
+    def _high_fidelity_applies(self) -> bool:
+        """Whether "Render every size from vector" changes the current export.
+
+        Only SVG icon and wallpaper sets render once and downscale; ICO/ICNS
+        always render per size, and custom export and PNG sources have no
+        vector to render from.
+        """
+        profile = self.profileCombo.currentText()
+        single_render = profile in (
+            "Custom export",
+            "Create Windows icon (.ico)",
+            "Create macOS icon (.icns)",
+        )
+        png_source = self.svg_path is not None and self.svg_path.lower().endswith(".png")
+        return not single_render and not png_source
+
     def on_load(self) -> None:
         """Prompt for a source file and load it into the preview."""
         path, _ = QFileDialog.getOpenFileName(
@@ -610,6 +1159,7 @@ class SvgConverterApp(QWidget):
             self.svg_path = path
             self.pathLine.setText(path)
             self.createBtn.setEnabled(True)
+            self.highFidelity.setEnabled(self._high_fidelity_applies())
             self.update_preview()
 
     def choose_bg_color(self) -> None:
@@ -627,8 +1177,31 @@ class SvgConverterApp(QWidget):
         """Prompt for an output directory; None if the user cancels."""
         return QFileDialog.getExistingDirectory(self, "Choose output directory") or None
 
+    def _current_svg_bytes(self, svg_path: str) -> bytes:
+        """Return the SVG source, re-reading it only if the file changed.
+
+        Bytes rather than a parsed tree are kept; see parse_svg.
+        """
+        key = (svg_path, Path(svg_path).stat().st_mtime_ns)
+        if self._svg_bytes is None or self._svg_bytes_key != key:
+            self._svg_bytes = _load_svg_bytes(svg_path)
+            self._svg_bytes_key = key
+        return self._svg_bytes
+
+    def _current_png_master(self, png_path: str) -> Image.Image:
+        """Return the decoded PNG input, decoding again only if the file changed."""
+        key = (png_path, Path(png_path).stat().st_mtime_ns)
+        if self._png_master is None or self._png_master_key != key:
+            self._png_master = load_png_master(png_path)
+            self._png_master_key = key
+        return self._png_master
+
     # ---- Preview ----
     def update_preview(self) -> None:
+        """Schedule a preview re-render, coalescing bursts of changes."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self) -> None:
         """Re-render the preview to match the current settings."""
         if not self.svg_path:
             self.previewImage.setText("No source loaded")
@@ -642,29 +1215,58 @@ class SvgConverterApp(QWidget):
         else:
             w, h = self.widthSpin.value(), self.heightSpin.value()
 
+        # Render cost scales with output pixels, and the label shows a few
+        # hundred at most, so render at preview size rather than export size.
+        # Padding scales with it so the preview keeps the exported proportions.
+        padding = self.paddingSpin.value()
+        label = self.previewImage.size()
+        scale = max(PREVIEW_MAX_SIDE, label.width(), label.height()) / max(w, h)
+        if scale < 1.0:
+            # U+00D7 MULTIPLICATION SIGN is intentional display text here.
+            self.previewLabel.setText(f"Preview (approximate, {w}×{h} export)")  # noqa: RUF001
+            w, h = max(1, int(w * scale)), max(1, int(h * scale))
+            padding = int(padding * scale)
+        else:
+            self.previewLabel.setText("Preview")
+
         try:
             if self.svg_path.lower().endswith(".png"):
-                pil = Image.open(self.svg_path)
-                pil = pil.convert("RGBA")
-                pil = pil.resize((w, h), LANCZOS_RESAMPLE)
+                master = self._current_png_master(self.svg_path)
+                pil = master.resize((w, h), LANCZOS_RESAMPLE)
             else:
-                pil = render_svg_to_pillow(
+                pil = render_svg_preview(
                     self.svg_path,
                     width=w,
                     height=h,
                     zoom=self.zoomSlider.value() / 100.0,
-                    padding=self.paddingSpin.value(),
+                    padding=padding,
                     transparent=self.transparentBg.isChecked(),
                     bg_color=self.bgColor,
+                    svg_bytes=self._current_svg_bytes(self.svg_path),
                 )
-            pix = pillow_to_qpixmap(pil)
-            self.previewImage.setPixmap(
-                pix.scaled(
-                    self.previewImage.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            # A preview-cache hit hands back the very same image; if the label
+            # has not been resized either, the last scaled pixmap is still
+            # exact. Holding `pil` in the key keeps the identity check sound.
+            label_size = self.previewImage.size()
+            last = self._last_scaled_key
+            if (
+                last is None
+                or last[0] is not pil
+                or last[1:] != (label_size.width(), label_size.height())
+            ):
+                # Fit to the label in Pillow, so the preview goes through one
+                # Lanczos pass rather than Pillow plus Qt's smooth scaling.
+                fit = min(label_size.width() / pil.width, label_size.height() / pil.height)
+                fit_size = (max(1, round(pil.width * fit)), max(1, round(pil.height * fit)))
+                fitted = pil
+                if fit_size != pil.size:
+                    try:
+                        fitted = pil.resize(fit_size, LANCZOS_RESAMPLE, reducing_gap=3.0)
+                    except TypeError:  # Pillow<7 has no reducing_gap
+                        fitted = pil.resize(fit_size, LANCZOS_RESAMPLE)
+                self._last_scaled = pillow_to_qpixmap(fitted)
+                self._last_scaled_key = (pil, label_size.width(), label_size.height())
+            self.previewImage.setPixmap(self._last_scaled)
         # Broad catch is deliberate: a malformed SVG must degrade to an
         # in-widget error message, never propagate out of a Qt slot and
         # terminate the application.
@@ -689,13 +1291,28 @@ class SvgConverterApp(QWidget):
         padding = self.paddingSpin.value()
         transparent = self.transparentBg.isChecked()
         bg = self.bgColor
-
-        name = Path(self.svg_path).stem
-
-        try:
+        fast = self.fastExport.isChecked()
+        high_fidelity = self.highFidelity.isChecked()
+
+        source = self.svg_path
+        name = Path(source).stem
+        # Decoded here, on the GUI thread, so the export shares the preview's
+        # master instead of re-reading the file per size. Read-only from now on.
+        png_master = None
+        if source.lower().endswith(".png"):
+            try:
+                png_master = self._current_png_master(source)
+            except OSError as e:
+                QMessageBox.critical(self, "Error", str(e))
+                return
+
+        # Runs on the export thread: no widget access in here, only the
+        # settings captured above. Failures propagate to ExportWorker, which
+        # reports them back to the GUI thread.
+        def run_export(progress: Callable[[int, int], None]) -> None:
 
             def save_custom_png(
-                src_path: str,
+                master: Image.Image,
                 out_dir: Path,
                 name: str,
                 w: int,
@@ -705,10 +1322,11 @@ class SvgConverterApp(QWidget):
                 zoom: float,
                 padding: int,
                 bg: QColor,
+                fast: bool = False,
             ) -> None:
                 out_dir.mkdir(parents=True, exist_ok=True)
                 img = render_png_to_pillow(
-                    src_path, w, h, zoom=zoom, padding=padding, transparent=True
+                    source, w, h, zoom=zoom, padding=padding, transparent=True, image=master
                 )
                 out = unique_path(out_dir / f"{name}_{w}x{h}.{fmt}")
                 if fmt == "pdf":
@@ -717,10 +1335,10 @@ class SvgConverterApp(QWidget):
                 else:
                     if fmt in ("jpg", "jpeg", "bmp") or not transparent:
                         img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-                    img.save(out)
+                    save_image(img, out, fast)
 
             def save_windows_ico_png(
-                src_path: str,
+                master: Image.Image,
                 out_dir: Path,
                 sizes: list[int],
                 transparent: bool,
@@ -731,19 +1349,24 @@ class SvgConverterApp(QWidget):
                 out_dir.mkdir(parents=True, exist_ok=True)
                 base = max(sizes)
                 src = render_png_to_pillow(
-                    src_path,
+                    source,
                     base,
                     base,
                     zoom=zoom,
                     padding=padding,
                     transparent=transparent,
                     bg_color=bg,
+                    image=master,
                 )
+                if sizes == WINDOWS_ICO_SIZES:
+                    pairs = WINDOWS_ICO_SIZE_PAIRS
+                else:
+                    pairs = tuple((s, s) for s in sorted(sizes, reverse=True))
                 ico_path = unique_path(out_dir / "icon.ico")
-                src.save(ico_path, format="ICO", sizes=[(s, s) for s in sizes])
+                src.save(ico_path, format="ICO", sizes=pairs)
 
             def save_macos_icns_png(
-                src_path: str,
+                master: Image.Image,
                 out_dir: Path,
                 sizes_for_check: list[int],
                 transparent: bool,
@@ -754,13 +1377,14 @@ class SvgConverterApp(QWidget):
                 out_dir.mkdir(parents=True, exist_ok=True)
                 base = max(sizes_for_check)
                 src = render_png_to_pillow(
-                    src_path,
+                    source,
                     base,
                     base,
                     zoom=zoom,
                     padding=padding,
                     transparent=transparent,
                     bg_color=bg,
+                    image=master,
                 )
                 if not transparent:
                     src = pillow_flatten(src, qcolor_to_rgba_tuple(bg))
@@ -774,13 +1398,14 @@ class SvgConverterApp(QWidget):
                         # Same fixed base/@2x naming iconutil requires.
                         for filename, px in macos_iconset_entries(sizes_for_check):
                             img = render_png_to_pillow(
-                                src_path,
+                                source,
                                 px,
                                 px,
                                 zoom=zoom,
                                 padding=padding,
                                 transparent=transparent,
                                 bg_color=bg,
+                                image=master,
                             )
                             img.save(iconset / filename)
                         proc = subprocess.run(
@@ -807,7 +1432,7 @@ class SvgConverterApp(QWidget):
                         raise
 
             def save_png_set_png(
-                src_path: str,
+                master: Image.Image,
                 out_dir: Path,
                 label: str,
                 name: str,
@@ -817,26 +1442,31 @@ class SvgConverterApp(QWidget):
                 padding: int,
                 bg: QColor,
                 fmt: str = "png",
+                fast: bool = False,
+                progress: Callable[[int, int], None] | None = None,
             ) -> None:
                 fmt = fmt.lower()
                 base = out_dir / label / name
                 base.mkdir(parents=True, exist_ok=True)
-                for s in sizes:
+                for done, s in enumerate(sizes, start=1):
                     img = render_png_to_pillow(
-                        src_path,
+                        source,
                         s,
                         s,
                         zoom=zoom,
                         padding=padding,
                         transparent=transparent,
                         bg_color=bg,
+                        image=master,
                     )
                     if fmt in ("jpg", "jpeg", "bmp") or not transparent:
                         img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-                    img.save(base / f"{name}_{s}x{s}.{fmt}")
+                    save_image(img, base / f"{name}_{s}x{s}.{fmt}", fast)
+                    if progress is not None:
+                        progress(done, len(sizes))
 
             def save_wallpapers_png(
-                src_path: str,
+                master: Image.Image,
                 out_dir: Path,
                 label: str,
                 name: str,
@@ -846,28 +1476,33 @@ class SvgConverterApp(QWidget):
                 padding: int,
                 bg: QColor,
                 fmt: str = "png",
+                fast: bool = False,
+                progress: Callable[[int, int], None] | None = None,
             ) -> None:
                 fmt = fmt.lower()
                 base = out_dir / "wallpapers" / label / name
                 base.mkdir(parents=True, exist_ok=True)
-                for sz in sizes:
+                for done, sz in enumerate(sizes, start=1):
                     img = render_png_to_pillow(
-                        src_path,
+                        source,
                         sz.width(),
                         sz.height(),
                         zoom=zoom,
                         padding=padding,
                         transparent=transparent,
                         bg_color=bg,
+                        image=master,
                     )
                     if fmt in ("jpg", "jpeg", "bmp") or not transparent:
                         img = pillow_flatten(img, qcolor_to_rgba_tuple(bg))
-                    img.save(base / f"{name}_{sz.width()}x{sz.height()}.{fmt}")
+                    save_image(img, base / f"{name}_{sz.width()}x{sz.height()}.{fmt}", fast)
+                    if progress is not None:
+                        progress(done, len(sizes))
 
-            if self.svg_path.lower().endswith(".png"):
+            if png_master is not None:
                 if profile == "Custom export":
                     save_custom_png(
-                        self.svg_path,
+                        png_master,
                         out_dir / "custom",
                         name,
                         w,
@@ -877,10 +1512,11 @@ class SvgConverterApp(QWidget):
                         zoom,
                         padding,
                         bg,
+                        fast=fast,
                     )
                 elif profile == "Create Windows icon (.ico)":
                     save_windows_ico_png(
-                        self.svg_path,
+                        png_master,
                         out_dir / "windows",
                         WINDOWS_ICO_SIZES,
                         transparent,
@@ -890,7 +1526,7 @@ class SvgConverterApp(QWidget):
                     )
                 elif profile == "Create macOS icon (.icns)":
                     save_macos_icns_png(
-                        self.svg_path,
+                        png_master,
                         out_dir / "macos",
                         MAC_ICON_SIZES,
                         transparent,
@@ -900,7 +1536,7 @@ class SvgConverterApp(QWidget):
                     )
                 elif profile == "Create Linux icon PNGs":
                     save_png_set_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "linux",
                         name,
@@ -910,10 +1546,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Create Android app icons":
                     save_png_set_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "android",
                         name,
@@ -923,10 +1561,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Create iOS app icons":
                     save_png_set_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "ios",
                         name,
@@ -936,10 +1576,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Export standard sizes: Computer":
                     save_wallpapers_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "desktop",
                         name,
@@ -949,10 +1591,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Export standard sizes: Phone":
                     save_wallpapers_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "phone",
                         name,
@@ -962,10 +1606,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Export tablet sizes: Portrait":
                     save_wallpapers_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "tablet_portrait",
                         name,
@@ -975,10 +1621,12 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 elif profile == "Export tablet sizes: Landscape":
                     save_wallpapers_png(
-                        self.svg_path,
+                        png_master,
                         out_dir,
                         "tablet_landscape",
                         name,
@@ -988,18 +1636,15 @@ class SvgConverterApp(QWidget):
                         padding,
                         bg,
                         fmt,
+                        fast=fast,
+                        progress=progress,
                     )
                 else:
-                    QMessageBox.warning(
-                        self,
-                        "Unsupported",
-                        f"Profile '{profile}' is not supported for PNG sources.",
-                    )
-                    return
+                    raise ValueError(f"Profile '{profile}' is not supported for PNG sources.")
             # ...existing code...
             elif profile == "Custom export":
                 save_custom(
-                    self.svg_path,
+                    source,
                     out_dir / "custom",
                     name,
                     w,
@@ -1009,11 +1654,12 @@ class SvgConverterApp(QWidget):
                     zoom,
                     padding,
                     bg,
+                    fast=fast,
                 )
 
             elif profile == "Create Windows icon (.ico)":
                 save_windows_ico(
-                    self.svg_path,
+                    source,
                     out_dir / "windows",
                     WINDOWS_ICO_SIZES,
                     transparent,
@@ -1024,7 +1670,7 @@ class SvgConverterApp(QWidget):
 
             elif profile == "Create macOS icon (.icns)":
                 save_macos_icns(
-                    self.svg_path,
+                    source,
                     out_dir / "macos",
                     MAC_ICON_SIZES,
                     transparent,
@@ -1035,7 +1681,7 @@ class SvgConverterApp(QWidget):
 
             elif profile == "Create Linux icon PNGs":
                 save_png_set(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "linux",
                     name,
@@ -1045,11 +1691,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Create Android app icons":
                 save_png_set(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "android",
                     name,
@@ -1059,11 +1708,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Create iOS app icons":
                 save_png_set(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "ios",
                     name,
@@ -1073,11 +1725,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Export standard sizes: Computer":
                 save_wallpapers(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "desktop",
                     name,
@@ -1087,11 +1742,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Export standard sizes: Phone":
                 save_wallpapers(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "phone",
                     name,
@@ -1101,11 +1759,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Export tablet sizes: Portrait":
                 save_wallpapers(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "tablet_portrait",
                     name,
@@ -1115,11 +1776,14 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
             elif profile == "Export tablet sizes: Landscape":
                 save_wallpapers(
-                    self.svg_path,
+                    source,
                     out_dir,
                     "tablet_landscape",
                     name,
@@ -1129,18 +1793,84 @@ class SvgConverterApp(QWidget):
                     padding,
                     bg,
                     fmt,
+                    high_fidelity=high_fidelity,
+                    fast=fast,
+                    progress=progress,
                 )
 
-            QMessageBox.information(self, "Done", f"Export complete to:\n{out_dir}")
+        self._start_export(run_export, out_dir)
 
-        # Broad catch is deliberate: any export failure must surface as a
-        # dialog rather than escaping a Qt slot and killing the app mid-run.
-        except Exception as e:  # noqa: BLE001
-            QMessageBox.critical(self, "Error", str(e))
+    def _start_export(
+        self, job: Callable[[Callable[[int, int], None]], None], out_dir: Path
+    ) -> None:
+        """Run an export job on a worker thread behind a progress dialog."""
+        self.createBtn.setEnabled(False)
+        self._export_dialog = ExportProgressDialog(self)
+        self._export_out_dir = out_dir
+
+        thread = QThread(self)
+        worker = ExportWorker(job)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        # Bound methods of self run on the GUI thread via queued connections.
+        worker.progress.connect(self._on_export_progress)
+        worker.finished.connect(self._on_export_finished)
+        worker.error.connect(self._on_export_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._on_export_thread_done)
+        # Held so neither is garbage-collected while the thread runs. The
+        # worker has no Qt parent, so dropping this reference is what frees it.
+        self._export_thread = thread
+        self._export_worker = worker
+        thread.start()
+
+    def _on_export_progress(self, done: int, total: int) -> None:
+        """Advance the progress dialog; called on the GUI thread."""
+        if self._export_dialog is not None:
+            self._export_dialog.setMaximum(total)
+            self._export_dialog.setValue(done)
+
+    def _close_export_dialog(self) -> None:
+        """Close the progress dialog, which deletes it (WA_DeleteOnClose)."""
+        if self._export_dialog is not None:
+            self._export_dialog.finish()
+            self._export_dialog = None
+
+    def _on_export_finished(self) -> None:
+        """Report a completed export."""
+        self._close_export_dialog()
+        QMessageBox.information(self, "Done", f"Export complete to:\n{self._export_out_dir}")
+
+    def _on_export_error(self, message: str) -> None:
+        """Report a failed export."""
+        self._close_export_dialog()
+        QMessageBox.critical(self, "Error", message)
+
+    def _on_export_thread_done(self) -> None:
+        """Release the finished thread and allow another export."""
+        if self._export_thread is not None:
+            # finished is emitted just before the thread exits; wait it out
+            # before the worker it owns is freed.
+            self._export_thread.wait()
+            self._export_thread.deleteLater()
+        self._export_thread = None
+        self._export_worker = None
+        self.createBtn.setEnabled(True)
+
+    def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802  (Qt override)
+        """Refuse to close mid-export: the window owns the running QThread."""
+        if self._export_thread is not None:
+            QMessageBox.information(self, "Export running", "Please wait for the export to finish.")
+            event.ignore()
+        else:
+            super().closeEvent(event)
 
 
 # ---------- Main ----------
 if __name__ == "__main__":
+    # Export workers are separate processes; frozen builds need this hook.
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     w = SvgConverterApp()
     w.resize(900, 520)
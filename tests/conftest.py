@@ -45,6 +45,31 @@ def square_svg(tmp_path: Path) -> str:
     return str(path)
 
 
+@pytest.fixture
+def use_pattern_svg(tmp_path: Path) -> str:
+    """A 100x100 SVG drawn through a positioned `<use>` and a `<pattern>` fill.
+
+    Any render path that reuses a parsed tree (see parse_svg) misplaces the
+    second tile or loses the pattern here; the plain square_svg cannot show it.
+    """
+    path = tmp_path / "use_pattern.svg"
+    path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+        ' width="100" height="100">'
+        "<defs>"
+        '<pattern id="stripes" width="10" height="10" patternUnits="userSpaceOnUse">'
+        '<rect width="5" height="10" fill="#0000ff"/>'
+        "</pattern>"
+        '<rect id="tile" width="50" height="50" fill="#ff0000"/>'
+        "</defs>"
+        '<rect x="50" width="50" height="50" fill="url(#stripes)"/>'
+        '<use xlink:href="#tile"/><use xlink:href="#tile" x="50" y="50"/>'
+        "</svg>",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
 @pytest.fixture
 def square_png(tmp_path: Path) -> str:
     """A 100x100 fully opaque red PNG, matching square_svg.
@@ -140,3 +140,368 @@ def test_save_windows_ico_writes_file(
 ) -> None:
     sc.save_windows_ico(square_svg, tmp_path, fmt_sizes, True, 1.0, 0, QColor("white"))
     assert (tmp_path / "icon.ico").exists()
+
+
+# ── performance paths must render the same pixels ──────────────────────
+
+
+def test_shared_bytes_match_path_render(use_pattern_svg: str) -> None:
+    """One read shared across sizes must match reading the file per size."""
+    svg_bytes = sc._load_svg_bytes(use_pattern_svg)  # noqa: SLF001
+    sizes = [(TARGET, TARGET), (32, 32), (TARGET, TARGET)]
+    vector = dict(sc.render_svg_sizes(use_pattern_svg, sizes, padding=4, high_fidelity=True))
+    for size, _ in sizes:
+        shared = sc.render_svg_to_pillow(
+            use_pattern_svg, size, size, padding=4, svg_bytes=svg_bytes
+        )
+        fresh = sc.render_svg_to_pillow(use_pattern_svg, size, size, padding=4)
+        assert shared.tobytes() == fresh.tobytes()
+        assert vector[size, size].tobytes() == fresh.tobytes()
+
+
+def test_render_once_keeps_padding_per_size(square_svg: str) -> None:
+    """Resizing from one master must not scale padding along with the image."""
+    sizes = [(TARGET, TARGET), (40, 40)]
+    rendered = dict(sc.render_svg_sizes(square_svg, sizes, padding=10, transparent=True))
+    largest = sc.render_svg_to_pillow(square_svg, TARGET, TARGET, padding=10)
+    assert rendered[TARGET, TARGET].tobytes() == largest.tobytes()
+    small = rendered[40, 40]
+    assert small.size == (40, 40)
+    assert small.getpixel((9, 20))[3] == 0, "10px of padding must stay transparent"
+    assert small.getpixel((20, 20))[:3] == RED
+
+
+def test_save_wallpapers_mixed_aspects_writes_every_size(square_svg: str, tmp_path: Path) -> None:
+    """Sizes with different aspect ratios are exported by separate workers."""
+    from PIL import Image
+    from PySide6.QtCore import QSize
+
+    sizes = [QSize(60, 30), QSize(40, 80), QSize(30, 15)]
+    sc.save_wallpapers(
+        square_svg, tmp_path, "desk", "sq", sizes, False, 1.0, 0, QColor("blue"), "jpg"
+    )
+    for sz in sizes:
+        out = tmp_path / "wallpapers" / "desk" / "sq" / f"sq_{sz.width()}x{sz.height()}.jpg"
+        with Image.open(out) as img:
+            assert img.size == (sz.width(), sz.height())
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "L"])
+def test_pillow_to_qpixmap_keeps_pixels(mode: str) -> None:
+    from PIL import Image
+
+    img = Image.new("RGBA", (7, 5), (255, 0, 0, 255)).convert(mode)
+    qimg = sc.pillow_to_qpixmap(img).toImage()
+    assert (qimg.width(), qimg.height()) == (7, 5)
+    expected = QColor(*img.convert("RGB").getpixel((3, 2)))
+    assert qimg.pixelColor(3, 2).rgb() == expected.rgb()
+
+
+def test_preview_updates_are_debounced(square_svg: str) -> None:
+    """A burst of control changes schedules one render instead of rendering each."""
+    from PySide6.QtTest import QTest
+
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app._preview_timer.stop()  # noqa: SLF001
+    for value in range(10, 20):
+        app.zoomSlider.setValue(value)
+    assert app.previewImage.pixmap().isNull(), "nothing renders until input settles"
+    assert app._preview_timer.isActive()  # noqa: SLF001
+    QTest.qWait(200)
+    assert not app.previewImage.pixmap().isNull()
+
+
+def test_preview_cache_reuses_until_file_changes(square_svg: str) -> None:
+    import os
+
+    args = (square_svg, 50, 50, 1.0, 0, True, QColor("white"))
+    first = sc.render_svg_preview(*args)
+    assert sc.render_svg_preview(*args) is first
+
+    stat = Path(square_svg).stat()
+    os.utime(square_svg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert sc.render_svg_preview(*args) is not first, "an edited file must re-render"
+
+
+def test_svg_source_is_read_once(square_svg: str) -> None:
+    import os
+
+    app = sc.SvgConverterApp()
+    source = app._current_svg_bytes(square_svg)  # noqa: SLF001
+    assert app._current_svg_bytes(square_svg) is source  # noqa: SLF001
+
+    stat = Path(square_svg).stat()
+    os.utime(square_svg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert app._current_svg_bytes(square_svg) is not source, "an edited file must re-read"  # noqa: SLF001
+
+
+def test_shared_source_previews_match_fresh_renders(use_pattern_svg: str) -> None:
+    """Cache misses after the first must not draw an already-drawn tree."""
+    sc._preview_cache.clear()  # noqa: SLF001
+    source = Path(use_pattern_svg).read_bytes()
+    white = QColor("white")
+    for size in (100, 60, 40):
+        preview = sc.render_svg_preview(use_pattern_svg, size, size, 1.0, 0, True, white, source)
+        fresh = sc.render_svg_to_pillow(use_pattern_svg, size, size)
+        assert preview.tobytes() == fresh.tobytes()
+
+
+def test_preview_renders_at_preview_size(square_svg: str) -> None:
+    """A 16384px export must not be rendered at 16384px just to be previewed."""
+    sc._preview_cache.clear()  # noqa: SLF001
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    export_w = 16384
+    app.widthSpin.setValue(export_w)
+    app.heightSpin.setValue(export_w // 2)
+    app._do_update_preview()  # noqa: SLF001
+    (key,) = sc._preview_cache  # noqa: SLF001
+    width, height = key[2], key[3]
+    assert max(width, height) < export_w
+    assert width == 2 * height, "the export's aspect ratio is preserved"
+
+
+@pytest.mark.parametrize("transparent", [True, False])
+def test_unpadded_render_fills_canvas(square_svg: str, transparent: bool) -> None:
+    """The no-compositing fast path still returns a full canvas in the right mode."""
+    img = sc.render_svg_to_pillow(square_svg, TARGET, TARGET, transparent=transparent)
+    assert img.size == (TARGET, TARGET)
+    assert img.mode == ("RGBA" if transparent else "RGB")
+    assert _corner(img)[:3] == RED
+
+
+def test_pillow_flatten_blends_partial_alpha() -> None:
+    from PIL import Image
+
+    half_red = Image.new("RGBA", (4, 4), (255, 0, 0, 128))
+    r, g, b = sc.pillow_flatten(half_red, (0, 0, 255, 255)).getpixel((1, 1))
+    assert abs(r - 128) <= 1
+    assert g == 0
+    assert abs(b - 127) <= 1
+
+
+def test_unchanged_preview_reuses_scaled_pixmap(square_svg: str) -> None:
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app._do_update_preview()  # noqa: SLF001
+    first = app.previewImage.pixmap().cacheKey()
+    app._do_update_preview()  # noqa: SLF001
+    assert app.previewImage.pixmap().cacheKey() == first
+
+
+def test_preview_pixmap_fits_label(square_svg: str) -> None:
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app._do_update_preview()  # noqa: SLF001
+    label = app.previewImage.size()
+    side = min(label.width(), label.height())
+    assert app.previewImage.pixmap().size().toTuple() == (side, side)
+
+
+def test_fast_save_is_lossless(tmp_path: Path) -> None:
+    from PIL import Image
+
+    img = Image.effect_noise((64, 64), 40).convert("RGB")
+    sc.save_image(img, tmp_path / "fast.png", fast=True)
+    with Image.open(tmp_path / "fast.png") as saved:
+        assert saved.tobytes() == img.tobytes()
+
+
+def test_export_runs_off_the_gui_thread(
+    square_svg: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """on_create returns immediately; the export completes on a worker thread."""
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QMessageBox, QProgressDialog
+
+    done: list[str] = []
+    monkeypatch.setattr(QMessageBox, "information", lambda *_: done.append("ok"))
+    monkeypatch.setattr(QMessageBox, "critical", lambda *a: done.append(a[2]))
+
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app.profileCombo.setCurrentText("Create Android app icons")
+    monkeypatch.setattr(app, "ask_output_dir", lambda: str(tmp_path))
+    app.on_create()
+    assert not app.createBtn.isEnabled(), "export in progress"
+
+    for _ in range(500):
+        if done and app.createBtn.isEnabled():
+            break
+        QTest.qWait(20)
+    assert done == ["ok"]
+    for s in sc.ANDROID_ICON_SIZES:
+        assert (tmp_path / "android" / "square" / f"square_{s}x{s}.png").exists()
+    QTest.qWait(50)  # let the closed dialog's deferred delete run
+    assert not app.findChildren(QProgressDialog), "the progress dialog must not leak"
+
+
+def test_dismissing_export_dialog_still_reports_result(
+    square_svg: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Escape, the close button and closing the window must not strand an export."""
+    from PySide6.QtCore import Qt
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QMessageBox
+
+    done: list[str] = []
+    monkeypatch.setattr(QMessageBox, "information", lambda *a: done.append(a[1]))
+    monkeypatch.setattr(QMessageBox, "critical", lambda *a: done.append(a[2]))
+
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app.profileCombo.setCurrentText("Create Android app icons")
+    monkeypatch.setattr(app, "ask_output_dir", lambda: str(tmp_path))
+    app.on_create()
+    dialog = app._export_dialog  # noqa: SLF001
+    assert dialog is not None
+    QTest.keyClick(dialog, Qt.Key.Key_Escape)
+    assert not dialog.close(), "the dialog stays up while the export runs"
+    assert not app.close(), "the window must not close under a running export"
+    assert done == ["Export running"]
+
+    for _ in range(500):
+        if len(done) > 1 and app.createBtn.isEnabled():
+            break
+        QTest.qWait(20)
+    assert done == ["Export running", "Done"]
+    assert app.close()
+
+
+def test_png_source_set_reports_progress(
+    square_png: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QMessageBox
+
+    monkeypatch.setattr(QMessageBox, "information", lambda *_: None)
+    app = sc.SvgConverterApp()
+    app.svg_path = square_png
+    app.profileCombo.setCurrentText("Create Android app icons")
+    monkeypatch.setattr(app, "ask_output_dir", lambda: str(tmp_path))
+    seen: list[tuple[int, int]] = []
+    monkeypatch.setattr(app, "_on_export_progress", lambda *a: seen.append(a))
+    app.on_create()
+    for _ in range(500):
+        if app.createBtn.isEnabled():
+            break
+        QTest.qWait(20)
+    total = len(sc.ANDROID_ICON_SIZES)
+    assert seen == [(done, total) for done in range(1, total + 1)]
+
+
+def test_semi_transparent_pixels_are_unpremultiplied(tmp_path: Path) -> None:
+    """Cairo stores premultiplied alpha; colour must come back at full strength."""
+    path = tmp_path / "half.svg"
+    path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+        '<rect width="10" height="10" fill="#ff0000" fill-opacity="0.5"/>'
+        "</svg>",
+        encoding="utf-8",
+    )
+    r, g, b, a = sc.render_svg_to_pillow(str(path), 10, 10).getpixel((5, 5))
+    assert abs(a - 128) <= 1
+    assert (r, g, b) == RED
+
+
+def test_ico_embeds_every_requested_size(square_svg: str, tmp_path: Path) -> None:
+    from PIL import Image
+
+    sc.save_windows_ico(square_svg, tmp_path, [16, 48, 32], False, 1.0, 0, QColor("blue"))
+    with Image.open(tmp_path / "icon.ico") as ico:
+        assert ico.info["sizes"] == {(16, 16), (32, 32), (48, 48)}
+
+
+def test_ico_padding_scales_with_each_entry(square_svg: str, tmp_path: Path) -> None:
+    """Padding set for the 256px entry must not swallow the 16px one."""
+    from PIL import Image
+
+    sc.save_windows_ico(square_svg, tmp_path, [256, 16], True, 1.0, 20, QColor("white"))
+    with Image.open(tmp_path / "icon.ico") as ico:
+        small = ico.ico.getimage((16, 16)).convert("RGBA")
+    assert small.getpixel((0, 0))[3] == 0, "scaled padding still insets the entry"
+    assert small.getpixel((8, 8)) == (*RED, 255)
+
+
+def test_save_macos_icns_writes_file(square_svg: str, tmp_path: Path) -> None:
+    sc.save_macos_icns(square_svg, tmp_path, sc.MAC_ICON_SIZES, True, 1.0, 0, QColor("white"))
+    assert (tmp_path / "icon.icns").exists()
+
+
+def test_icon_size_pairs_are_largest_first() -> None:
+    assert sc.WINDOWS_ICO_SIZE_PAIRS[0] == (256, 256)
+    assert sc.MAC_ICON_SIZE_PAIRS[0] == (1024, 1024)
+    assert sorted(s for s, _ in sc.WINDOWS_ICO_SIZE_PAIRS) == sc.WINDOWS_ICO_SIZES
+    assert sorted(s for s, _ in sc.MAC_ICON_SIZE_PAIRS) == sc.MAC_ICON_SIZES
+
+
+def test_render_once_opaque_uses_background(square_svg: str) -> None:
+    sizes = [(TARGET, TARGET), (40, 40)]
+    rendered = dict(
+        sc.render_svg_sizes(
+            square_svg, sizes, padding=10, transparent=False, bg_color=QColor("blue")
+        )
+    )
+    for img in rendered.values():
+        assert img.mode == "RGB"
+        assert _corner(img) == BLUE
+        assert img.getpixel((20, 20)) == RED
+
+
+def test_png_master_is_decoded_once(tmp_path: Path) -> None:
+    import os
+
+    from PIL import Image
+
+    png = tmp_path / "src.png"
+    Image.new("RGBA", (64, 64), (255, 0, 0, 255)).save(png)
+    app = sc.SvgConverterApp()
+    master = app._current_png_master(str(png))  # noqa: SLF001
+    assert app._current_png_master(str(png)) is master  # noqa: SLF001
+    img = sc.render_png_to_pillow(str(png), 32, 32, image=master)
+    assert img.size == (32, 32)
+    assert master.size == (64, 64), "the shared master must not be modified"
+
+    stat = png.stat()
+    os.utime(png, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert app._current_png_master(str(png)) is not master  # noqa: SLF001
+
+
+def test_high_fidelity_checkbox_only_enabled_where_it_applies(square_png: str) -> None:
+    app = sc.SvgConverterApp()
+    for profile, enabled in [
+        ("Create Linux icon PNGs", True),
+        ("Export standard sizes: Phone", True),
+        ("Custom export", False),
+        ("Create Windows icon (.ico)", False),
+        ("Create macOS icon (.icns)", False),
+    ]:
+        app.profileCombo.setCurrentText(profile)
+        assert app.highFidelity.isEnabled() is enabled, profile
+    app.svg_path = square_png
+    app.profileCombo.setCurrentText("Create Linux icon PNGs")
+    assert not app.highFidelity.isEnabled(), "PNG sources have no vector to render"
+
+
+def test_high_fidelity_checkbox_reaches_export(
+    square_svg: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QMessageBox
+
+    calls: list[bool] = []
+    monkeypatch.setattr(QMessageBox, "information", lambda *_: None)
+    monkeypatch.setattr(sc, "save_png_set", lambda *_, **kw: calls.append(kw["high_fidelity"]))
+
+    app = sc.SvgConverterApp()
+    app.svg_path = square_svg
+    app.profileCombo.setCurrentText("Create Linux icon PNGs")
+    app.highFidelity.setChecked(True)
+    monkeypatch.setattr(app, "ask_output_dir", lambda: str(tmp_path))
+    app.on_create()
+    for _ in range(500):
+        if app.createBtn.isEnabled():
+            break
+        QTest.qWait(20)
+    assert calls == [True]